@@ -4,5 +4,5 @@ py-meta: A library for Python meta-programming and module introspection utilitie
 This package provides utilities for dynamic module importing, entry point registration, 
 and other meta-programming features for Python applications.
 """
-import init
-init.init_package()
+from . import init as _init
+_init.init_package(globals_dict=globals())
@@ -1,12 +1,42 @@
-import pkgutil
+import os
+import sys
+import pickle
 import importlib
-import inspect
-from typing import Dict, Set, Optional, Union, List, Any, Mapping
+import importlib.machinery
+from typing import Dict, Set, Optional, Union, List, Any, Mapping, Iterator, Tuple, AbstractSet
+
+# File suffixes that make a directory entry importable as a module, longest
+# first so e.g. '.cpython-312-x86_64-linux-gnu.so' wins over '.so'
+_MODULE_SUFFIXES = tuple(sorted(importlib.machinery.all_suffixes(), key=len, reverse=True))
+
+# Results of previous import_submodules calls, keyed by their arguments, along
+# with the package object they were applied to
+_WALK_CACHE: Dict[tuple, Tuple[Any, Dict[str, Any]]] = {}
+
+# Submodules discovered under each package, keyed by (package name, recursive, exclude),
+# along with the directory mtimes they were discovered from
+_DISCOVERY_CACHE: Dict[tuple, Tuple[Dict[str, int], List[Tuple[str, str, bool]]]] = {}
+
+# On-disk index of discovered submodules, stored in the package's __pycache__
+_INDEX_NAME = '_submodules.idx'
+_INDEX_VERSION = 4
+
+# Fully qualified names of submodules that raised ImportError in this process
+_FAILED_IMPORTS: Set[str] = set()
+
+# Upper bound on threads used to import modules concurrently
+_MAX_IMPORT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Raised by the import system when module locks held by two threads wait on
+# each other, e.g. for a circular import split across workers
+_IMPORT_DEADLOCK_ERROR = getattr(importlib._bootstrap, '_DeadlockError', ())
 
 class PackageMetadata:
     """
     A class to hold package metadata.
     """
+    __slots__ = ('name', 'description', 'version')
+    
     def __init__(
         self,
         name: str,
@@ -21,6 +51,8 @@ class PackageOptions:
     """
     A class to hold package options.
     """
+    __slots__ = ('metadata', 'exclude_modules', 'alias_map')
+    
     def __init__(
         self,
         metadata: PackageMetadata,
@@ -32,23 +64,41 @@ class PackageOptions:
         self.alias_map = alias_map or {}
 
 def init_package(
-    package_options: PackageOptions,
+    package_options: Optional[PackageOptions] = None,
     exclude_modules: Optional[Union[Set[str], List[str]]] = None,
     globals_dict: Optional[Dict[str, Any]] = None,
+    eager: bool = False,
 ):
     """
     Initialize a module with metadata.
     
     Args:
-        package_options: Options for the package.
+        package_options: Options for the package. If None, the package name is
+                         taken from globals_dict.
         exclude_modules: Names to exclude from importing.
-        globals_dict: Dictionary of global variables to use.
+        globals_dict: Dictionary of global variables to use (defaults to caller's globals).
+        eager: Whether to import every submodule up front instead of on
+               first attribute access.
+    
+    Examples:
+        # In a package's __init__.py
+        init_package(globals_dict=globals())
     """
+    if package_options is None:
+        if globals_dict is None:
+            globals_dict = sys._getframe(1).f_globals
+        package_name = globals_dict['__name__']
+        alias_map = None
+    else:
+        package_name = package_options.metadata.name
+        alias_map = package_options.alias_map
+    
     import_submodules(
-        package_name=package_options.metadata.name,
+        package_name=package_name,
         exclude=exclude_modules,
-        alias_map=package_options.alias_map,
-        globals_dict=globals_dict)
+        alias_map=alias_map,
+        globals_dict=globals_dict,
+        eager=eager)
 
 def import_submodules(
     package_name: Optional[str] = None,
@@ -56,11 +106,21 @@ def import_submodules(
     recursive: bool = True,
     exclude: Optional[Union[Set[str], List[str]]] = None,
     alias_map: Optional[Mapping[str, str]] = None,
-    globals_dict: Optional[Dict[str, Any]] = None
+    globals_dict: Optional[Dict[str, Any]] = None,
+    eager: bool = False,
+    parallel: bool = False
 ) -> Dict[str, Any]:
     """
     Dynamically imports all submodules of the package.
     
+    By default only subpackages are imported; plain modules are registered
+    in their parent package's __lazy_map__ without being run, and imported
+    by a module-level __getattr__ (PEP 562) the first time they are
+    accessed, so their import errors surface on that first access.
+    
+    Results are memoized per set of arguments; call
+    import_submodules.cache_clear() to force a fresh walk.
+    
     Args:
         package_name: The package name (e.g., 'mypackage'). If None, uses the 
                       caller's module name from globals_dict.
@@ -68,9 +128,12 @@ def import_submodules(
         exclude: Names to exclude from importing.
         alias_map: Mapping from module names to aliases to use when importing.
         globals_dict: Dictionary of global variables to use (defaults to caller's globals).
+        eager: Whether to import every submodule immediately.
+        parallel: Whether to import independent modules on a thread pool.
         
     Returns:
-        Dict mapping from module names (or their aliases) to imported module objects.
+        Dict mapping from module names (or their aliases) to imported module objects,
+        or to fully qualified module names when eager is False.
     
     Examples:
         # Import all submodules in the current package
@@ -84,19 +147,29 @@ def import_submodules(
         
         # Import with aliases
         modules = import_submodules(alias_map={'database': 'db', 'utilities': 'utils'})
+        
+        # Import everything up front instead of on first access
+        modules = import_submodules(eager=True)
     """
     # Handle optional package_name parameter
     if package_name is None:
         if globals_dict is None:
-            globals_dict = inspect.currentframe().f_back.f_globals
+            globals_dict = sys._getframe(1).f_globals
         package_name = globals_dict.get('__name__', '')
     
     # Convert exclude to a set for O(1) lookups
-    exclude_set = set(exclude or [])
+    exclude_set = frozenset(exclude or [])
     
     # Initialize alias map if not provided
     alias_map = alias_map or {}
     
+    # Return the memoized result of an identical previous call, unless the
+    # package has been re-imported since and needs its namespace set up again
+    cache_key = (package_name, recursive, exclude_set, frozenset(alias_map.items()), eager)
+    cached = _WALK_CACHE.get(cache_key)
+    if cached is not None and sys.modules.get(package_name) is cached[0]:
+        return cached[1].copy()
+    
     # Import the package
     try:
         package = importlib.import_module(package_name)
@@ -108,51 +181,468 @@ def import_submodules(
     
     # Check if the package has a proper __path__ attribute
     if not hasattr(package, '__path__'):
-        return imported_modules
+        _WALK_CACHE[cache_key] = (package, imported_modules)
+        return imported_modules.copy()
     
-    # Iterate through package contents
-    for _, module_name, is_pkg in pkgutil.walk_packages(
-        package.__path__, 
-        prefix=f"{package.__name__}."
-    ):
-        # Extract the short name from the fully qualified name
-        short_name = module_name.split('.')[-1]
+    # Discover the package contents, reusing a previous walk while none of
+    # the walked directories have changed
+    discovery_key = (package.__name__, recursive, exclude_set)
+    walked_index = None
+    discovered = _DISCOVERY_CACHE.get(discovery_key)
+    if discovered is None or not _index_is_fresh(discovered[0]):
+        # Fall back to the on-disk index before walking the filesystem
+        index_path = _index_path(package)
+        index = _load_index(index_path)
+        index_key = (tuple(package.__path__), recursive, tuple(sorted(exclude_set)))
+        discovered = index.get(index_key)
+        if discovered is None or not _index_is_fresh(discovered[0]):
+            dir_mtimes: Dict[str, int] = {}
+            submodules = [
+                submodule
+                for path in package.__path__
+                for submodule in _iter_submodules(
+                    path,
+                    f"{package.__name__}.",
+                    recursive=recursive,
+                    exclude=exclude_set,
+                    mtimes=dir_mtimes
+                )
+            ]
+            discovered = index[index_key] = (dir_mtimes, submodules)
+            walked_index = (index_path, index)
+        _DISCOVERY_CACHE[discovery_key] = discovered
+    submodules = discovered[1]
+    
+    # Import the modules up front; plain modules are deferred in lazy mode
+    modules = _import_modules(
+        [
+            parent_prefix + short_name
+            for parent_prefix, short_name, is_pkg in submodules
+            if eager or is_pkg
+        ],
+        parallel=parallel
+    )
+    
+    # Importing the walked packages writes their __pycache__ directories, so
+    # the directory mtimes are only final once the import pass is done
+    if walked_index is not None:
+        _refresh_mtimes(discovered[0])
+        _save_index(*walked_index)
+    
+    # Each parent's __all__ list, paired with a set for O(1) membership tests
+    exports: Dict[str, Tuple[List[str], Set[str]]] = {}
+    
+    # Bind hot lookups locally for the loop
+    sys_modules = sys.modules
+    
+    for parent_prefix, short_name, is_pkg in submodules:
+        module_name = parent_prefix + short_name
+        parent_name = parent_prefix[:-1]
         
-        # Skip modules that should be excluded
-        if short_name.startswith('_') or short_name in exclude_set:
+        # Skip modules whose parent package failed to import
+        parent = sys_modules.get(parent_name)
+        if parent is None:
             continue
         
-        # Import the module
+        # Skip modules that failed to import
+        if module_name in _FAILED_IMPORTS:
+            continue
+        if eager or is_pkg:
+            module = modules.get(module_name)
+            if module is None:
+                continue
+        
+        # Check if module should use an alias, with a single lookup
+        _alias = alias_map.get(short_name)
+        if _alias is None:
+            _alias = short_name
+            module_key = module_name
+        else:
+            # Use the alias for the module key
+            module_key = parent_prefix + _alias
+        
+        if eager:
+            imported_modules[module_key] = module
+        else:
+            # The walk (or its fresh index) already located the module, so
+            # nothing needs resolving until it is first accessed
+            imported_modules[module_key] = module_name
+            _lazy_map(parent)[_alias] = module_name
+        
+        # Update the parent package's __all__ attribute
+        export = exports.get(parent_name)
+        if export is None:
+            all_list = parent.__dict__.setdefault('__all__', [])
+            if not isinstance(all_list, list):
+                all_list = parent.__all__ = list(all_list)
+            export = exports[parent_name] = (all_list, set(all_list))
+        all_list, all_set = export
+        if _alias not in all_set:
+            all_set.add(_alias)
+            all_list.append(_alias)
+    
+    _WALK_CACHE[cache_key] = (package, imported_modules)
+    return imported_modules.copy()
+
+def _import_modules(module_names: List[str], *, parallel: bool = False) -> Dict[str, Any]:
+    """
+    Imports modules, skipping those that raise ImportError.
+    
+    Failures are recorded in _FAILED_IMPORTS and not retried on later calls.
+    
+    Modules are imported one nesting level at a time, so every package is
+    loaded before its children and children of packages that failed to
+    import are not attempted. With parallel set, each level is imported on
+    a thread pool to overlap the file I/O of independent modules. Modules
+    that fail only because they ran outside the main thread (see
+    _is_thread_failure) are recorded as failed rather than imported again,
+    since their top-level code already ran in part; any other error is
+    re-raised as in a serial import. Threads are not used while any import
+    is in progress, since workers could block on module locks held by the
+    calling thread.
+    
+    Args:
+        module_names: Fully qualified module names, parents before children.
+        parallel: Whether to import each level concurrently.
+        
+    Returns:
+        Dict mapping module names to the imported module objects.
+    """
+    sys_modules = sys.modules
+    _import = importlib.import_module
+    imported: Dict[str, Any] = {}
+    
+    # Group modules by nesting depth, keeping discovery order within a level
+    levels: Dict[int, List[str]] = {}
+    for module_name in module_names:
+        levels.setdefault(module_name.count('.'), []).append(module_name)
+    
+    if parallel and _import_in_progress():
+        parallel = False
+    
+    for depth in sorted(levels):
+        pending = []
+        for module_name in levels[depth]:
+            # Skip known failures and modules whose parent package failed to import
+            if (module_name in _FAILED_IMPORTS
+                    or module_name.rpartition('.')[0] not in sys_modules):
+                continue
+            
+            # Reuse already imported modules without going through the import
+            # machinery; a module still initializing (possibly in another
+            # thread) goes through import_module so its module lock is honored
+            module = sys_modules.get(module_name)
+            if module is None or getattr(module.__spec__, '_initializing', False):
+                pending.append(module_name)
+            else:
+                imported[module_name] = module
+        
+        if parallel and len(pending) > 1:
+            # Imported here since concurrent.futures pulls in logging
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+            
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_IMPORT_WORKERS, len(pending))
+            ) as executor:
+                futures = {
+                    executor.submit(_import, module_name): module_name
+                    for module_name in pending
+                }
+                for future in as_completed(futures):
+                    module_name = futures[future]
+                    try:
+                        imported[module_name] = future.result()
+                    except ImportError:
+                        _FAILED_IMPORTS.add(module_name)
+                    except Exception as e:
+                        if not _is_thread_failure(e):
+                            raise
+                        _FAILED_IMPORTS.add(module_name)
+        else:
+            for module_name in pending:
+                try:
+                    imported[module_name] = _import(module_name)
+                except ImportError:
+                    # Silently skip modules that can't be imported
+                    # In an enterprise setting, you might want to log this instead
+                    _FAILED_IMPORTS.add(module_name)
+    
+    return imported
+
+def _is_thread_failure(error: BaseException) -> bool:
+    """
+    Checks whether an import failed only because it ran in a worker thread.
+    
+    Args:
+        error: The exception raised by the import.
+        
+    Returns:
+        True for import lock deadlocks between workers and for the
+        ValueError signal.signal raises outside the main thread.
+    """
+    if isinstance(error, _IMPORT_DEADLOCK_ERROR):
+        return True
+    return isinstance(error, ValueError) and 'main thread' in str(error)
+
+def _import_in_progress() -> bool:
+    """
+    Checks whether any module is still executing its top-level code.
+    
+    Returns:
+        True if some module in sys.modules is mid-import.
+    """
+    return any(
+        getattr(getattr(module, '__spec__', None), '_initializing', False)
+        for module in list(sys.modules.values())
+    )
+
+def _lazy_map(package: Any) -> Dict[str, str]:
+    """
+    Returns the package's __lazy_map__, installing it on first use.
+    
+    The map goes from attribute names to fully qualified module names. A
+    module-level __getattr__ (PEP 562) is installed alongside it to import
+    the mapped module on first access and bind it on the package, falling
+    back to any __getattr__ the package already defined.
+    
+    Args:
+        package: The package module object.
+        
+    Returns:
+        The package's mutable lazy map.
+    """
+    namespace = package.__dict__
+    if '__lazy_map__' in namespace:
+        return namespace['__lazy_map__']
+    
+    lazy_map: Dict[str, str] = {}
+    fallback = namespace.get('__getattr__')
+    
+    def __getattr__(name: str) -> Any:
+        module_name = lazy_map.get(name)
+        if module_name is None:
+            if fallback is not None:
+                return fallback(name)
+            raise AttributeError(f"module {package.__name__!r} has no attribute {name!r}")
+        # import_module honors the per-module import lock, so concurrent
+        # importers never see a half-executed module
         try:
             module = importlib.import_module(module_name)
+        except ImportError:
+            _FAILED_IMPORTS.add(module_name)
+            raise
+        setattr(package, name, module)
+        return module
+    
+    namespace['__lazy_map__'] = lazy_map
+    namespace['__getattr__'] = __getattr__
+    return lazy_map
+
+def _cache_clear() -> None:
+    """
+    Clears the memoized results and known import failures of import_submodules.
+    """
+    _WALK_CACHE.clear()
+    _DISCOVERY_CACHE.clear()
+    _FAILED_IMPORTS.clear()
+
+import_submodules.cache_clear = _cache_clear
+
+def _iter_submodules(
+    path: str,
+    prefix: str,
+    *,
+    recursive: bool = True,
+    exclude: AbstractSet[str] = frozenset(),
+    mtimes: Optional[Dict[str, int]] = None
+) -> Iterator[Tuple[str, str, bool]]:
+    """
+    Discovers the importable submodules under a package directory.
+    
+    Each directory is listed with a single os.scandir call and the cached
+    DirEntry type information, so no extra stat is issued per module.
+    Private names (leading underscore) and excluded names are skipped, and
+    excluded packages are not descended into.
+    
+    Args:
+        path: Filesystem path of the package directory.
+        prefix: Fully qualified package name followed by a dot.
+        recursive: Whether to descend into subpackages.
+        exclude: Short names to skip.
+        mtimes: If given, receives the st_mtime_ns of every directory whose
+                contents affect the result, for index freshness checks.
+        
+    Yields:
+        Tuples of (parent prefix, short name, is_pkg), parents before children,
+        where the parent prefix is the dotted parent package name plus a dot.
+    """
+    # Worklist of directories being listed, innermost last; each holds the
+    # package prefix, the directory path, the remaining sorted entries and
+    # the names seen so far
+    stack = [(prefix, path, _scandir_sorted(path, mtimes), set())]
+    while stack:
+        prefix, _, entries, seen = stack[-1]
+        for entry in entries:
+            # Symlinked subpackage directories are followed, like pkgutil does
+            is_pkg = entry.is_dir()
+            if is_pkg:
+                name = entry.name
+            else:
+                # Strip the suffix that matched, so names with extra dots
+                # (e.g. 'config.v2.py') fail the identifier check below
+                for suffix in _MODULE_SUFFIXES:
+                    if entry.name.endswith(suffix):
+                        name = entry.name[:-len(suffix)]
+                        break
+                else:
+                    continue
             
-            # Check if module should use an alias
-            module_key = module_name
-            if short_name in alias_map:
-                # Use the alias for the module key
-                module_key = module_name.rsplit('.', 1)[0] + '.' + alias_map[short_name]
+            if (name[:1] == '_' or name in exclude or name in seen
+                    or not name.isidentifier()):
+                continue
             
-            imported_modules[module_key] = module
+            # Only regular packages are importable subpackages
+            if is_pkg:
+                if mtimes is not None:
+                    try:
+                        mtimes[entry.path] = os.stat(entry.path).st_mtime_ns
+                    except OSError:
+                        continue
+                if not os.path.isfile(os.path.join(entry.path, '__init__.py')):
+                    continue
+                # Don't follow a symlink back into a directory being listed
+                if entry.is_symlink() and _is_ancestor_dir(entry.path, stack):
+                    continue
+            seen.add(name)
+            
+            yield prefix, name, is_pkg
             
-            # Update the package's __all__ attribute if it exists
-            _alias = alias_map.get(short_name, short_name)
-            package.__all__ = getattr(package, '__all__', [])
-            if _alias not in package.__all__:
-                package.__all__.append(_alias)
-                
-            # Recursively import submodules if requested
+            # Descend into the subpackage before the remaining siblings
             if recursive and is_pkg:
-                sub_modules = import_submodules(
-                    module_name,
-                    recursive=recursive,
-                    exclude=exclude_set,
-                    alias_map=alias_map
-                )
-                imported_modules.update(sub_modules)
-                
-        except ImportError as e:
-            # Silently skip modules that can't be imported
-            # In an enterprise setting, you might want to log this instead
+                stack.append((f"{prefix}{name}.", entry.path, _scandir_sorted(entry.path, mtimes), set()))
+                break
+        else:
+            stack.pop()
+
+def _is_ancestor_dir(path: str, stack: List[tuple]) -> bool:
+    """
+    Checks whether a directory resolves to one already on the walk's worklist.
+    
+    Args:
+        path: The directory to check.
+        stack: The worklist of _iter_submodules.
+        
+    Returns:
+        True if following path would loop back into a directory being listed.
+    """
+    real_path = os.path.realpath(path)
+    return any(os.path.realpath(dir_path) == real_path for _, dir_path, _, _ in stack)
+
+def _scandir_sorted(path: str, mtimes: Optional[Dict[str, int]] = None) -> Iterator[os.DirEntry]:
+    """
+    Lists a directory with os.scandir, sorted by name.
+    
+    Args:
+        path: The directory to list.
+        mtimes: If given and path isn't recorded yet, receives its st_mtime_ns.
+        
+    Returns:
+        An iterator over the entries, empty if the directory can't be read.
+    """
+    try:
+        if mtimes is not None and path not in mtimes:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        with os.scandir(path) as it:
+            return iter(sorted(it, key=lambda entry: entry.name))
+    except OSError:
+        return iter(())
+
+def _index_path(package: Any) -> Optional[str]:
+    """
+    Returns the location of the package's on-disk submodule index.
+    
+    Args:
+        package: The package module object.
+        
+    Returns:
+        The index file path, or None if the package has no directory.
+    """
+    for path in package.__path__:
+        return os.path.join(path, '__pycache__', _INDEX_NAME)
+    return None
+
+def _load_index(path: Optional[str]) -> Dict[tuple, Any]:
+    """
+    Loads a submodule index written by _save_index.
+    
+    Args:
+        path: The index file path.
+        
+    Returns:
+        The stored walks, or an empty dict if the index is missing or unreadable.
+    """
+    if path is None:
+        return {}
+    try:
+        with open(path, 'rb') as f:
+            version, walks = pickle.load(f)
+    except Exception:
+        return {}
+    if version != _INDEX_VERSION or not isinstance(walks, dict):
+        return {}
+    return walks
+
+def _save_index(path: Optional[str], data: Dict[tuple, Any]) -> None:
+    """
+    Atomically writes a submodule index, ignoring unwritable locations.
+    
+    Like bytecode caching, this is skipped when sys.dont_write_bytecode is set.
+    
+    Args:
+        path: The index file path.
+        data: The walks to store.
+    """
+    if path is None or sys.dont_write_bytecode:
+        return
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((_INDEX_VERSION, data), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
             pass
-            
-    return imported_modules
+
+def _refresh_mtimes(mtimes: Dict[str, int]) -> None:
+    """
+    Re-reads the modification times of the directories recorded by a walk.
+    
+    Directories that can no longer be read get a modification time of -1,
+    which never compares fresh.
+    
+    Args:
+        mtimes: Directory paths mapped to their st_mtime_ns, updated in place.
+    """
+    for path in mtimes:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = -1
+
+def _index_is_fresh(mtimes: Mapping[str, int]) -> bool:
+    """
+    Checks whether none of the recorded directories changed since a walk.
+    
+    Args:
+        mtimes: Directory paths mapped to their st_mtime_ns at walk time.
+        
+    Returns:
+        True if every directory still exists with the same modification time.
+    """
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in mtimes.items())
+    except OSError:
+        return False
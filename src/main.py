@@ -1,24 +1,62 @@
 import sys
-import asyncio
-import inspect
-import logging
-from typing import Any, Callable, Tuple, Dict, Optional, TypeVar, cast, Union, List
+import functools
+from typing import Any, Callable, Tuple, Dict, Optional, TypeVar, cast, Union, List, TYPE_CHECKING
 
-# Create a default logger but don't make it the only option
-default_logger = logging.getLogger(__name__)
-default_logger.setLevel(logging.INFO)
+if TYPE_CHECKING:
+    import logging
+
+# The default logger is created on first use so that importing this module
+# doesn't import logging; it is still available as `default_logger`
+_default_logger: Optional['logging.Logger'] = None
+
+def _get_default_logger() -> 'logging.Logger':
+    """
+    Returns the module's default logger, creating it on first use.
+    """
+    global _default_logger
+    if _default_logger is None:
+        import logging
+        _default_logger = logging.getLogger(__name__)
+        _default_logger.setLevel(logging.INFO)
+    return _default_logger
+
+# Code flag set on functions defined with `async def` (inspect.CO_COROUTINE)
+_CO_COROUTINE = 0x80
+
+def _is_coroutine_function(func: Callable[..., Any]) -> bool:
+    """
+    Checks whether func is a coroutine function without importing asyncio.
+    
+    If asyncio is already loaded its check is used, which also honors the
+    markers it and inspect place on coroutine-returning wrappers; otherwise
+    the code flags of the (partial-unwrapped) function are inspected.
+    """
+    asyncio = sys.modules.get('asyncio')
+    if asyncio is not None:
+        return asyncio.iscoroutinefunction(func)
+    while isinstance(func, functools.partial):
+        func = func.func
+    code = getattr(func, '__code__', None)
+    return code is not None and bool(code.co_flags & _CO_COROUTINE)
+
+def __getattr__(name: str) -> Any:
+    if name == 'default_logger':
+        return _get_default_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class EntryPoint:
     """
     A helper class to wrap an entry point function with default arguments.
     """
+    __slots__ = ('func', 'init_args', 'init_kwargs', 'logger', '_is_coro', '_asyncio_run')
+    
     def __init__(
         self, 
         func: Callable[..., Any],
         init_args: Tuple[Any, ...] = (), 
         init_kwargs: Optional[Dict[str, Any]] = None,
         *, 
-        logger: Optional[logging.Logger] = None
+        logger: Optional['logging.Logger'] = None
     ) -> None:
         """
         Initialize an entry point.
@@ -27,12 +65,17 @@ class EntryPoint:
             func: The target function to be invoked.
             init_args: Default positional arguments for func.
             init_kwargs: Default keyword arguments for func.
-            logger: The logger instance to use for logging.
+            logger: The logger instance to use for logging. Defaults to the
+                    module's default logger, resolved only when needed.
         """
         self.func = func
         self.init_args = init_args
         self.init_kwargs = init_kwargs or {}
-        self.logger = logger or default_logger
+        self.logger = logger
+        # Resolve once whether func must be driven by an event loop
+        self._is_coro = _is_coroutine_function(func)
+        # asyncio.run, bound on the first coroutine run
+        self._asyncio_run: Optional[Callable[..., Any]] = None
 
     def run(self, *args: Any, **kwargs: Any) -> Any:
         """
@@ -48,17 +91,24 @@ class EntryPoint:
             The return value of the function.
         """
         # If no runtime arguments are provided, default to sys.argv[1:].
+        # Only allocate combined containers when both sides contribute.
         args_to_use = args or (sys.argv[1:],)
-        combined_args = self.init_args + args_to_use
-        combined_kwargs = {**self.init_kwargs, **kwargs}
+        combined_args = self.init_args + args_to_use if self.init_args else args_to_use
+        combined_kwargs = {**self.init_kwargs, **kwargs} if kwargs else self.init_kwargs
         
+        func = self.func
         try:
-            if asyncio.iscoroutinefunction(self.func):
-                return asyncio.run(self.func(*combined_args, **combined_kwargs))
+            if self._is_coro:
+                asyncio_run = self._asyncio_run
+                if asyncio_run is None:
+                    import asyncio
+                    asyncio_run = self._asyncio_run = asyncio.run
+                return asyncio_run(func(*combined_args, **combined_kwargs))
             else:
-                return self.func(*combined_args, **combined_kwargs)
+                return func(*combined_args, **combined_kwargs)
         except Exception as e:
-            self.logger.exception(f"Error running entry point {self.func.__name__}: {e}")
+            logger = self.logger or _get_default_logger()
+            logger.exception(f"Error running entry point {func.__name__}: {e}")
             raise
 
 
@@ -69,7 +119,7 @@ def register_entry_point(
     init_args: Optional[Tuple[Any, ...]] = None,
     init_kwargs: Optional[Dict[str, Any]] = None,
     target_globals: Optional[Dict[str, Any]] = None,
-    logger: Optional[logging.Logger] = None,
+    logger: Optional['logging.Logger'] = None,
     exit_on_completion: bool = True
 ) -> Callable[..., Any]:
     """
@@ -104,26 +154,28 @@ def register_entry_point(
     """
     init_args = init_args or ()
     init_kwargs = init_kwargs or {}
-    logger_to_use = logger or default_logger
     
     # Use explicit globals if provided; otherwise get from caller frame
     if target_globals is None:
-        target_globals = inspect.currentframe().f_back.f_globals
+        target_globals = sys._getframe(1).f_globals
+    mod_name = target_globals.get('__name__', '<unknown>')
         
     # Check if entry_name already exists in the target globals
     if entry_name in target_globals:
         existing = target_globals[entry_name]
-        logger_to_use.error("Entry point %r already defined: %r", entry_name, existing)
+        (logger or _get_default_logger()).error(
+            "Entry point %r already defined: %r", entry_name, existing
+        )
         raise RuntimeError(
             f"A callable named {entry_name!r} is already defined in module "
-            f"{target_globals.get('__name__', '<unknown>')}: {existing!r}"
+            f"{mod_name}: {existing!r}"
         )
         
     ep = EntryPoint(
         func=func, 
         init_args=init_args, 
         init_kwargs=init_kwargs, 
-        logger=logger_to_use
+        logger=logger
     )
     
     def _entry(*args: Any, **kwargs: Any) -> Any:
@@ -134,23 +186,24 @@ def register_entry_point(
                 sys.exit(result)
             return result
         except KeyboardInterrupt:
-            logger_to_use.info("Operation interrupted by user")
+            (logger or _get_default_logger()).info("Operation interrupted by user")
             sys.exit(130)  # Standard exit code for SIGINT
     
     # Copy the function metadata to the entry point
-    _entry.__name__ = func.__name__
-    _entry.__doc__ = func.__doc__
-    _entry.__module__ = func.__module__
+    functools.update_wrapper(_entry, func)
     
     target_globals[entry_name] = _entry
-    logger_to_use.info(
-        "Registered entry point %r in module %r", 
-        entry_name, 
-        target_globals.get("__name__", "<unknown>")
-    )
+    # Until logging is imported no handler can be configured, so an info
+    # record from the default logger would be dropped; skip creating it
+    if logger is not None or 'logging' in sys.modules:
+        (logger or _get_default_logger()).info(
+            "Registered entry point %r in module %r", 
+            entry_name, 
+            mod_name
+        )
     
     # If this module is being executed directly, run the injected entry point.
-    if target_globals.get("__name__") == "__main__":
+    if mod_name == "__main__":
         _entry()
         
     return func  # Return the original function for use as a decorator